@@ -8,39 +8,116 @@ status, and affected countries.
 """
 
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
+from concurrent.futures import ThreadPoolExecutor
 import json
 import csv
-import pandas as pd
 from typing import List, Dict, Any
 import time
 import re
+from collections import Counter
 from urllib.parse import urljoin, urlparse
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional speedup for JSON export
+    orjson = None
+
+
+FALLBACK_DATA_FILE = Path(__file__).with_name("fallback_conflicts.json")
+CACHE_NAME = Path(__file__).with_name("cfr_cache")
+
+
+@lru_cache(maxsize=1)
+def _read_fallback_data() -> str:
+    """Read the fallback conflict file from disk once per process."""
+    return FALLBACK_DATA_FILE.read_text(encoding='utf-8')
 
 
 class CFRConflictScraper:
     """Scraper for CFR Global Conflict Tracker data."""
     
-    def __init__(self):
+    __slots__ = ('base_url', 'tracker_url', 'session', 'conflicts')
+    
+    # Upper bound on concurrent page fetches
+    MAX_WORKERS = 16
+    
+    # Field labels as they appear on the page, mapped to conflict keys
+    LABELS = {
+        'region': 'region',
+        'type of conflict': 'type',
+        'impact on us interests': 'us_impact',
+        'conflict status': 'status',
+        'countries affected': 'countries',
+    }
+    # Patterns are compiled once per process rather than per page or entry
+    _CONTAINER_RE = re.compile(r'conflict|entry|item', re.I)
+    _KEYWORD_RE = re.compile(r'Conflict|Instability|War|Crisis', re.I)
+    _COUNTRY_SPLIT = re.compile(r'\s*,\s*')
+    # One alternation matches every "Label: value" pair; a value runs up to the
+    # next label, a "|" separator, a line break or the end of the entry text
+    _LABEL_ALT = r'Region|Type of Conflict|Impact on US Interests|Conflict Status|Countries Affected'
+    _LABEL_RE = re.compile(
+        rf'({_LABEL_ALT})\s*:\s*([^\n|]*?)[^\S\n]*(?=[\n|]|(?:{_LABEL_ALT})\s*:|$)',
+        re.I,
+    )
+    
+    # Elements that start a new line in the entry text, so a label's value
+    # stops at the end of the element that holds it
+    _BLOCK_TAGS = frozenset({
+        'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt',
+        'figcaption', 'figure', 'footer', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header',
+        'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'td', 'th',
+        'tr', 'ul',
+    })
+    _WHITESPACE_RE = re.compile(r'\s+')
+    
+    def __init__(self, cache_name: Path = CACHE_NAME):
         self.base_url = "https://www.cfr.org"
         self.tracker_url = "https://www.cfr.org/global-conflict-tracker"
-        self.session = requests.Session()
+        # Cache responses on disk and revalidate them with ETag/Last-Modified,
+        # so repeated runs skip re-downloading unchanged pages
+        self.session = requests_cache.CachedSession(str(cache_name), expire_after=3600, cache_control=True)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Keep connections alive across fetches and retry transient failures
+        adapter = HTTPAdapter(pool_connections=self.MAX_WORKERS,
+                              pool_maxsize=self.MAX_WORKERS,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.conflicts = []
     
-    def fetch_page(self, url: str) -> BeautifulSoup:
+    def fetch_page(self, url: str) -> lxml.html.HtmlElement:
         """Fetch and parse a webpage."""
         try:
+            # requests-cache buffers the whole body to store it, so the response
+            # is parsed from response.content rather than streamed
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            return lxml.html.document_fromstring(response.content)
         except requests.RequestException as e:
             print(f"Error fetching {url}: {e}")
             return None
+        except etree.LxmlError as e:
+            print(f"Error parsing {url}: {e}")
+            return None
+    
+    def fetch_pages(self, urls: List[str]) -> List[lxml.html.HtmlElement]:
+        """Fetch and parse several webpages concurrently, preserving order."""
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(urls), self.MAX_WORKERS)) as executor:
+            return list(executor.map(self.fetch_page, urls))
     
-    def extract_conflict_data(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def extract_conflict_data(self, root: lxml.html.HtmlElement) -> List[Dict[str, Any]]:
         """Extract conflict data from the main tracker page."""
         conflicts = []
         
@@ -51,55 +128,80 @@ class CFRConflictScraper:
         # In a real implementation, you'd need to inspect the actual HTML structure
         
         # For now, let's create a parser that can handle the data format shown
-        conflict_entries = soup.find_all(['div', 'article', 'section'], 
-                                       class_=re.compile(r'conflict|entry|item', re.I))
+        conflict_entries = [elem for elem in root.iter('div', 'article', 'section')
+                            if self._CONTAINER_RE.search(elem.get('class', ''))]
         
         if not conflict_entries:
-            # Fallback: look for any elements containing conflict information
-            conflict_entries = soup.find_all(string=re.compile(r'Conflict|Instability|War|Crisis', re.I))
-            conflict_entries = [elem.parent for elem in conflict_entries if elem.parent]
+            # Fallback: look for any elements containing conflict information,
+            # either in their own text or in the tail text following a child
+            conflict_entries = [
+                elem for elem in root.iter(etree.Element)
+                if (elem.text and self._KEYWORD_RE.search(elem.text))
+                or any(child.tail and self._KEYWORD_RE.search(child.tail) for child in elem)
+            ]
         
-        for entry in conflict_entries:
-            conflict_data = self.parse_conflict_entry(entry)
+        parsed = [(entry, self.parse_conflict_entry(entry)) for entry in conflict_entries]
+        
+        # A container holding a named conflict of its own is a list wrapper,
+        # not a conflict, so only its inner cards are kept
+        wrappers = set()
+        for entry, conflict_data in parsed:
             if conflict_data:
+                wrappers.update(entry.iterancestors())
+        
+        # The same conflict can appear in more than one card; keep the first one
+        seen_names = set()
+        for entry, conflict_data in parsed:
+            if entry in wrappers:
+                continue
+            if conflict_data and conflict_data['name'] not in seen_names:
+                seen_names.add(conflict_data['name'])
                 conflicts.append(conflict_data)
         
         return conflicts
     
+    def entry_text(self, entry) -> str:
+        """Return the entry's text with one line per block-level element."""
+        parts = []
+        
+        def collect(elem):
+            block = elem.tag in self._BLOCK_TAGS
+            if block:
+                parts.append('\n')
+            if elem.text:
+                parts.append(self._WHITESPACE_RE.sub(' ', elem.text))
+            for child in elem:
+                # Comments and processing instructions contribute only their tail
+                if isinstance(child.tag, str):
+                    collect(child)
+                if child.tail:
+                    parts.append(self._WHITESPACE_RE.sub(' ', child.tail))
+            if block:
+                parts.append('\n')
+        
+        collect(entry)
+        return ''.join(parts)
+    
     def parse_conflict_entry(self, entry) -> Dict[str, Any]:
         """Parse individual conflict entry."""
         conflict = {}
         
         # Extract conflict name (usually in a heading or title)
-        name_elem = entry.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'a'])
-        if name_elem:
-            conflict['name'] = name_elem.get_text(strip=True)
-        
-        # Extract region
-        region_elem = entry.find(string=re.compile(r'Region:', re.I))
-        if region_elem:
-            conflict['region'] = region_elem.parent.get_text(strip=True).replace('Region:', '').strip()
-        
-        # Extract conflict type
-        type_elem = entry.find(string=re.compile(r'Type of Conflict:', re.I))
-        if type_elem:
-            conflict['type'] = type_elem.parent.get_text(strip=True).replace('Type of Conflict:', '').strip()
+        name_elem = next(entry.iterdescendants('h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'a'), None)
+        if name_elem is not None:
+            conflict['name'] = name_elem.text_content().strip()
         
-        # Extract US impact
-        impact_elem = entry.find(string=re.compile(r'Impact on US Interests:', re.I))
-        if impact_elem:
-            conflict['us_impact'] = impact_elem.parent.get_text(strip=True).replace('Impact on US Interests:', '').strip()
-        
-        # Extract status
-        status_elem = entry.find(string=re.compile(r'Conflict Status:', re.I))
-        if status_elem:
-            conflict['status'] = status_elem.parent.get_text(strip=True).replace('Conflict Status:', '').strip()
-        
-        # Extract countries affected
-        countries_elem = entry.find(string=re.compile(r'Countries Affected:', re.I))
-        if countries_elem:
-            countries_text = countries_elem.parent.get_text(strip=True).replace('Countries Affected:', '').strip()
-            conflict['countries'] = [c.strip() for c in countries_text.split(',')]
+        # Extract the labelled fields from a single pass over the entry text
+        text = self.entry_text(entry)
+        for match in self._LABEL_RE.finditer(text):
+            key = self.LABELS[match.group(1).lower()]
+            if key in conflict:
+                continue
+            value = match.group(2)
+            if key == 'countries':
+                conflict['countries'] = self._COUNTRY_SPLIT.split(value)
+            else:
+                conflict[key] = value
         
         # Only return if we have at least a name
         return conflict if conflict.get('name') else None
@@ -107,15 +209,15 @@ class CFRConflictScraper:
     def scrape_conflicts(self) -> List[Dict[str, Any]]:
         """Main method to scrape all conflict data."""
         print("Fetching CFR Global Conflict Tracker...")
-        soup = self.fetch_page(self.tracker_url)
+        root = self.fetch_page(self.tracker_url)
         
-        if not soup:
+        if root is None:
             print("Failed to fetch the main page")
             print("Using fallback data extraction...")
             conflicts = self.get_fallback_data()
         else:
             print("Extracting conflict data...")
-            conflicts = self.extract_conflict_data(soup)
+            conflicts = self.extract_conflict_data(root)
             
             # If the automatic extraction didn't work well, use the provided data
             if not conflicts or len(conflicts) < 10:  # Expect at least 10 conflicts
@@ -126,234 +228,18 @@ class CFRConflictScraper:
         print(f"Found {len(conflicts)} conflicts")
         return conflicts
     
+    def scrape_many(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """Scrape conflict data from several pages concurrently."""
+        conflicts = []
+        for root in self.fetch_pages(urls):
+            if root is not None:
+                conflicts.extend(self.extract_conflict_data(root))
+        return conflicts
+    
     def get_fallback_data(self) -> List[Dict[str, Any]]:
         """Fallback data based on the provided website content."""
-        return [
-            {
-                "name": "Instability in the Northern Triangle",
-                "region": "Americas",
-                "type": "Political Instability",
-                "us_impact": "Significant",
-                "status": "Unchanging",
-                "countries": ["SV", "GT", "HN"]
-            },
-            {
-                "name": "Instability in Haiti",
-                "region": "Americas",
-                "type": "Political Instability",
-                "us_impact": "Significant",
-                "status": "Worsening",
-                "countries": ["HT"]
-            },
-            {
-                "name": "Civil War in Sudan",
-                "region": "Middle East and North Africa",
-                "type": "Civil War",
-                "us_impact": "Limited",
-                "status": "Worsening",
-                "countries": ["SD"]
-            },
-            {
-                "name": "Violent Extremism in the Sahel",
-                "region": "Middle East and North Africa",
-                "type": "Transnational Terrorism",
-                "us_impact": "Limited",
-                "status": "Worsening",
-                "countries": ["BF", "TD", "ML", "NE", "NG"]
-            },
-            {
-                "name": "Confrontation Over Taiwan",
-                "region": "Asia",
-                "type": "Interstate",
-                "us_impact": "Critical",
-                "status": "Worsening",
-                "countries": ["CN", "TW"]
-            },
-            {
-                "name": "Conflict in Ethiopia",
-                "region": "Sub-Saharan Africa",
-                "type": "Political Instability",
-                "us_impact": "Limited",
-                "status": "Worsening",
-                "countries": ["ET"]
-            },
-            {
-                "name": "Iran's Conflict With Israel and the United States",
-                "region": "Middle East and North Africa",
-                "type": "Interstate",
-                "us_impact": "Critical",
-                "status": "Worsening",
-                "countries": ["IR"]
-            },
-            {
-                "name": "U.S. Confrontation With Venezuela",
-                "region": "Americas",
-                "type": "Interstate",
-                "us_impact": "Limited",
-                "status": "Unchanging",
-                "countries": ["VE"]
-            },
-            {
-                "name": "Conflict in Yemen and the Red Sea",
-                "region": "Middle East and North Africa",
-                "type": "Transnational Terrorism",
-                "us_impact": "Significant",
-                "status": "Worsening",
-                "countries": ["YE"]
-            },
-            {
-                "name": "Conflict Between India and Pakistan",
-                "region": "Asia",
-                "type": "Interstate",
-                "us_impact": "Significant",
-                "status": "Worsening",
-                "countries": ["IN", "PK"]
-            },
-            {
-                "name": "Civil Conflict in Libya",
-                "region": "Middle East and North Africa",
-                "type": "Civil War",
-                "us_impact": "Limited",
-                "status": "Unchanging",
-                "countries": ["LY"]
-            },
-            {
-                "name": "Conflict With Al-Shabaab in Somalia",
-                "region": "Sub-Saharan Africa",
-                "type": "Transnational Terrorism",
-                "us_impact": "Limited",
-                "status": "Unchanging",
-                "countries": ["SO"]
-            },
-            {
-                "name": "Israeli-Palestinian Conflict",
-                "region": "Middle East and North Africa",
-                "type": "Territorial Dispute",
-                "us_impact": "Significant",
-                "status": "Worsening",
-                "countries": ["IL", "PS"]
-            },
-            {
-                "name": "Criminal Violence in Mexico",
-                "region": "Americas",
-                "type": "Criminal Violence",
-                "us_impact": "Significant",
-                "status": "Unchanging",
-                "countries": ["MX"]
-            },
-            {
-                "name": "Conflict Between Turkey and Armed Kurdish Groups",
-                "region": "Middle East and North Africa",
-                "type": "Territorial Dispute",
-                "us_impact": "Limited",
-                "status": "Improving",
-                "countries": ["IQ", "SY", "TR"]
-            },
-            {
-                "name": "Instability in Iraq",
-                "region": "Middle East and North Africa",
-                "type": "Political Instability",
-                "us_impact": "Limited",
-                "status": "Worsening",
-                "countries": ["IQ"]
-            },
-            {
-                "name": "Instability in South Sudan",
-                "region": "Sub-Saharan Africa",
-                "type": "Political Instability",
-                "us_impact": "Limited",
-                "status": "Unchanging",
-                "countries": ["SS"]
-            },
-            {
-                "name": "War in Ukraine",
-                "region": "Europe and Eurasia",
-                "type": "Interstate",
-                "us_impact": "Critical",
-                "status": "Worsening",
-                "countries": ["RU", "UA"]
-            },
-            {
-                "name": "North Korea Crisis",
-                "region": "Asia",
-                "type": "Interstate",
-                "us_impact": "Critical",
-                "status": "Unchanging",
-                "countries": ["KP"]
-            },
-            {
-                "name": "Civil War in Myanmar",
-                "region": "Asia",
-                "type": "Civil War",
-                "us_impact": "Limited",
-                "status": "Worsening",
-                "countries": ["MM"]
-            },
-            {
-                "name": "Territorial Disputes in the South China Sea",
-                "region": "Asia",
-                "type": "Territorial Dispute",
-                "us_impact": "Critical",
-                "status": "Unchanging",
-                "countries": ["BN", "CN", "ID", "MY", "PH", "TW", "VN"]
-            },
-            {
-                "name": "Conflict in the Democratic Republic of Congo",
-                "region": "Sub-Saharan Africa",
-                "type": "Political Instability",
-                "us_impact": "Limited",
-                "status": "Worsening",
-                "countries": ["CD"]
-            },
-            {
-                "name": "Conflict in the Central African Republic",
-                "region": "Sub-Saharan Africa",
-                "type": "Civil War",
-                "us_impact": "Limited",
-                "status": "Unchanging",
-                "countries": ["CF"]
-            },
-            {
-                "name": "Conflict With Hezbollah in Lebanon",
-                "region": "Middle East and North Africa",
-                "type": "Interstate",
-                "us_impact": "Significant",
-                "status": "Worsening",
-                "countries": ["LB"]
-            },
-            {
-                "name": "Conflict in Syria",
-                "region": "Middle East and North Africa",
-                "type": "Civil War",
-                "us_impact": "Limited",
-                "status": "Worsening",
-                "countries": ["SY"]
-            },
-            {
-                "name": "Instability in Afghanistan",
-                "region": "Asia",
-                "type": "Political Instability",
-                "us_impact": "Limited",
-                "status": "Worsening",
-                "countries": ["AF"]
-            },
-            {
-                "name": "Instability in Pakistan",
-                "region": "Asia",
-                "type": "Political Instability",
-                "us_impact": "Limited",
-                "status": "Worsening",
-                "countries": ["PK"]
-            },
-            {
-                "name": "Tensions Between Armenia and Azerbaijan",
-                "region": "Europe and Eurasia",
-                "type": "Territorial Dispute",
-                "us_impact": "Limited",
-                "status": "Improving",
-                "countries": ["AM", "AZ"]
-            }
-        ]
+        # Decode on every call so callers never share the cached records
+        return json.loads(_read_fallback_data())
     
     def export_to_csv(self, filename: str = "cfr_conflicts.csv"):
         """Export conflicts data to CSV file."""
@@ -361,8 +247,16 @@ class CFRConflictScraper:
             print("No conflicts data to export")
             return
         
-        df = pd.DataFrame(self.conflicts)
-        df.to_csv(filename, index=False)
+        # Columns in first-seen order, matching the key order of the records
+        fieldnames = list(dict.fromkeys(key for conflict in self.conflicts for key in conflict))
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(
+                {key: ','.join(value) if isinstance(value, list) else value
+                 for key, value in conflict.items()}
+                for conflict in self.conflicts
+            )
         print(f"Data exported to {filename}")
     
     def export_to_json(self, filename: str = "cfr_conflicts.json"):
@@ -371,8 +265,12 @@ class CFRConflictScraper:
             print("No conflicts data to export")
             return
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.conflicts, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(self.conflicts, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(self.conflicts, f, indent=2, ensure_ascii=False)
         print(f"Data exported to {filename}")
     
     def analyze_data(self):
@@ -381,33 +279,30 @@ class CFRConflictScraper:
             print("No conflicts data to analyze")
             return
         
-        df = pd.DataFrame(self.conflicts)
-        
         print("\n=== CFR Global Conflict Tracker Analysis ===")
-        print(f"Total conflicts: {len(df)}")
-        
-        print("\nBy Region:")
-        print(df['region'].value_counts())
-        
-        print("\nBy Conflict Type:")
-        print(df['type'].value_counts())
-        
-        print("\nBy US Impact:")
-        print(df['us_impact'].value_counts())
+        print(f"Total conflicts: {len(self.conflicts)}")
         
-        print("\nBy Status:")
-        print(df['status'].value_counts())
+        for title, key in (("By Region", 'region'),
+                           ("By Conflict Type", 'type'),
+                           ("By US Impact", 'us_impact'),
+                           ("By Status", 'status')):
+            print(f"\n{title}:")
+            # Records without the field are left out, as value_counts() did
+            counts = Counter(conflict.get(key) for conflict in self.conflicts
+                             if conflict.get(key) is not None)
+            for value, count in counts.most_common():
+                print(f"  {value}: {count}")
         
         print("\nCritical Conflicts (High US Impact):")
-        critical = df[df['us_impact'] == 'Critical']
-        for _, conflict in critical.iterrows():
-            print(f"- {conflict['name']} ({conflict['region']})")
+        critical = [c for c in self.conflicts if c.get('us_impact') == 'Critical']
+        for conflict in critical:
+            print(f"- {conflict['name']} ({conflict.get('region')})")
         
         print("\nWorsening Conflicts:")
-        worsening = df[df['status'] == 'Worsening']
+        worsening = [c for c in self.conflicts if c.get('status') == 'Worsening']
         print(f"Total: {len(worsening)}")
-        for _, conflict in worsening.iterrows():
-            print(f"- {conflict['name']} ({conflict['region']})")
+        for conflict in worsening:
+            print(f"- {conflict['name']} ({conflict.get('region')})")
 
 
 def main():
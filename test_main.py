@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Tests for the CFR Global Conflict Tracker scraper."""
+
+import contextlib
+import http.server
+import io
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import lxml.html
+
+from main import CFRConflictScraper
+
+
+PAGE = (
+    b'<html><body>'
+    + b'<div class="conflict"><h2>War in Ukraine</h2><p>Region: Europe and Eurasia</p></div>' * 40
+    + b'</body></html>'
+)
+
+
+class PageHandler(http.server.BaseHTTPRequestHandler):
+    """Serve pages with an explicit Content-Length, like the CFR site does.
+
+    /missing returns 404, /conflict/<name> a single card named <name> and
+    any other path PAGE.
+    """
+
+    def do_GET(self):
+        if self.path == '/missing':
+            self.send_error(404)
+            return
+        if self.path.startswith('/conflict/'):
+            name = self.path.rsplit('/', 1)[1]
+            body = f'<html><body><div class="conflict"><h2>{name}</h2></div></body></html>'.encode()
+        else:
+            body = PAGE
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ScraperTestCase(unittest.TestCase):
+    """Run each test with a fresh scraper caching to a temporary directory."""
+
+    def setUp(self):
+        # Keep the on-disk response cache out of the working tree
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.scraper = CFRConflictScraper(cache_name=Path(self.tmpdir.name) / 'cfr_cache')
+
+    def tearDown(self):
+        self.scraper.session.close()
+        self.tmpdir.cleanup()
+
+
+class FetchPageTest(ScraperTestCase):
+    """fetch_page against a live local server through the cached session."""
+
+    def setUp(self):
+        super().setUp()
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        super().tearDown()
+
+    def test_uncached_fetch_succeeds(self):
+        root = self.scraper.fetch_page(self.url)
+        self.assertIsNotNone(root)
+        conflicts = self.scraper.extract_conflict_data(root)
+        self.assertEqual(conflicts, [{'name': 'War in Ukraine', 'region': 'Europe and Eurasia'}])
+
+    def test_cached_fetch_succeeds(self):
+        self.scraper.fetch_page(self.url)
+        root = self.scraper.fetch_page(self.url)
+        self.assertIsNotNone(root)
+
+    def test_scrape_many_keeps_order_and_skips_failed_pages(self):
+        # More pages than MAX_WORKERS so every worker shares the cached session
+        names = [f'conflict{i:02d}' for i in range(2 * self.scraper.MAX_WORKERS)]
+        urls = [f"{self.url}conflict/{name}" for name in names]
+        urls.insert(3, f"{self.url}missing")
+
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            conflicts = self.scraper.scrape_many(urls)
+
+        self.assertEqual([conflict['name'] for conflict in conflicts], names)
+        self.assertIn(f"Error fetching {self.url}missing", output.getvalue())
+
+
+class ParseConflictEntryTest(ScraperTestCase):
+    """Label values stay inside the element that holds them."""
+
+    def parse(self, markup):
+        return self.scraper.parse_conflict_entry(lxml.html.fragment_fromstring(markup))
+
+    def test_value_stops_at_element_boundary(self):
+        conflict = self.parse(
+            '<div class="conflict"><h3>War in Ukraine</h3>'
+            '<p>Region: Europe and Eurasia</p>'
+            '<p>Countries Affected: RU, UA</p>'
+            '<p>Russia launched a full-scale invasion in 2022.</p>'
+            '<a href="/ukraine">Read more</a></div>'
+        )
+        self.assertEqual(conflict['region'], 'Europe and Eurasia')
+        self.assertEqual(conflict['countries'], ['RU', 'UA'])
+
+    def test_value_spans_inline_markup(self):
+        conflict = self.parse(
+            '<div><h3>War in Ukraine</h3>'
+            '<p><strong>Countries Affected:</strong> <span>RU</span>,\n  <span>UA</span></p></div>'
+        )
+        self.assertEqual(conflict['countries'], ['RU', 'UA'])
+
+    def test_value_in_following_element(self):
+        conflict = self.parse(
+            '<div><h3>North Korea Crisis</h3>'
+            '<dl><dt>Region:</dt><dd>Asia</dd><dt>Conflict Status:</dt><dd>Unchanging</dd></dl></div>'
+        )
+        self.assertEqual(conflict['region'], 'Asia')
+        self.assertEqual(conflict['status'], 'Unchanging')
+
+    def test_labels_separated_by_pipe(self):
+        conflict = self.parse(
+            '<div><h3>North Korea Crisis</h3><p>Region: Asia | Conflict Status: Unchanging</p></div>'
+        )
+        self.assertEqual(conflict['region'], 'Asia')
+        self.assertEqual(conflict['status'], 'Unchanging')
+
+
+class ExtractConflictDataTest(ScraperTestCase):
+    """Conflict cards are found, wrappers skipped and duplicates dropped."""
+
+    def test_wrapper_container_is_skipped(self):
+        root = lxml.html.document_fromstring(
+            '<html><body><section class="conflicts-list"><h2>Active Conflicts</h2>'
+            '<div class="conflict-card"><h3>War in Ukraine</h3>'
+            '<p>Region: Europe and Eurasia</p><p>Countries Affected: RU, UA</p></div>'
+            '<div class="conflict-card"><h3>Civil War in Myanmar</h3>'
+            '<p>Region: Asia</p><p>Countries Affected: MM</p></div>'
+            '</section></body></html>'
+        )
+        self.assertEqual(self.scraper.extract_conflict_data(root), [
+            {'name': 'War in Ukraine', 'region': 'Europe and Eurasia', 'countries': ['RU', 'UA']},
+            {'name': 'Civil War in Myanmar', 'region': 'Asia', 'countries': ['MM']},
+        ])
+
+    def test_card_with_unnamed_inner_containers_is_kept(self):
+        root = lxml.html.document_fromstring(
+            '<html><body>'
+            '<article class="entry"><h2>War in Ukraine</h2>'
+            '<div class="entry-content"><p>Region: Europe and Eurasia</p></div></article>'
+            '<article class="entry"><h2>Civil War in Myanmar</h2>'
+            '<div class="item-meta"><p>Region: Asia</p></div></article>'
+            '</body></html>'
+        )
+        self.assertEqual(self.scraper.extract_conflict_data(root), [
+            {'name': 'War in Ukraine', 'region': 'Europe and Eurasia'},
+            {'name': 'Civil War in Myanmar', 'region': 'Asia'},
+        ])
+
+    def test_duplicate_names_are_dropped(self):
+        root = lxml.html.document_fromstring(
+            '<html><body>'
+            '<div class="conflict"><h3>War in Ukraine</h3><p>Region: Europe and Eurasia</p></div>'
+            '<div class="conflict"><h3>War in Ukraine</h3><p>Region: Europe</p></div>'
+            '</body></html>'
+        )
+        self.assertEqual(self.scraper.extract_conflict_data(root), [
+            {'name': 'War in Ukraine', 'region': 'Europe and Eurasia'},
+        ])
+
+    def test_keyword_fallback_without_containers(self):
+        root = lxml.html.document_fromstring(
+            '<html><body>'
+            '<section><h3>War in Ukraine</h3> Conflict status tracked <p>Region: Europe</p></section>'
+            '</body></html>'
+        )
+        self.assertEqual(self.scraper.extract_conflict_data(root), [
+            {'name': 'War in Ukraine', 'region': 'Europe'},
+        ])
+
+
+class FallbackDataTest(ScraperTestCase):
+    """get_fallback_data hands out independent copies of the cached data."""
+
+    def test_mutation_does_not_leak_between_calls(self):
+        data = self.scraper.get_fallback_data()
+        original = data[0]['countries'][:]
+        data[0]['countries'].append('ZZ')
+        data[0]['name'] = 'Changed'
+        fresh = self.scraper.get_fallback_data()
+        self.assertEqual(fresh[0]['countries'], original)
+        self.assertNotEqual(fresh[0]['name'], 'Changed')
+
+
+class AnalyzeDataTest(ScraperTestCase):
+    """analyze_data counts only the records that have each field."""
+
+    def test_missing_fields_are_not_counted(self):
+        self.scraper.conflicts = [
+            {'name': 'War in Ukraine', 'region': 'Europe and Eurasia', 'status': 'Worsening'},
+            {'name': 'North Korea Crisis'},
+        ]
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.scraper.analyze_data()
+        self.assertIn("  Europe and Eurasia: 1", output.getvalue())
+        self.assertNotIn("None", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()